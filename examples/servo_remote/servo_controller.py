@@ -73,18 +73,27 @@ with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
     with conn:
         conn_to_master = conn
         print(f"Connected to master: {addr}")
-        while True:
+        # Each command is a line of JSON. Several commands can arrive at 
+        # once, and a command can be split over several receives.
+        buffer = b""
+        shutdown = False
+        while not shutdown:
             data = conn.recv(1024)
             if not data:
                 break
-            try:
-                command = json.loads(data.decode())
-                response = handle_command(command.get("command", ""))
-            except Exception as e:
-                response = {"status": "error", "message": str(e)}
-
-            conn.sendall((json.dumps(response) + "\n").encode())
-
-            if command.get("command") == "shutdown":
-                print("Shutdown received. Closing connection.")
-                break
+            buffer += data
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                command = {}
+                try:
+                    command = json.loads(line.decode())
+                    response = handle_command(command.get("command", ""))
+                except Exception as e:
+                    response = {"status": "error", "message": str(e)}
+
+                conn.sendall((json.dumps(response) + "\n").encode())
+
+                if command.get("command") == "shutdown":
+                    print("Shutdown received. Closing connection.")
+                    shutdown = True
+                    break
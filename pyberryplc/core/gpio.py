@@ -1,9 +1,12 @@
+import time
+from functools import partial
 from abc import ABC, abstractmethod
 from gpiozero.pins.pigpio import PiGPIOFactory, PiFactory
 from gpiozero import DigitalInputDevice, DigitalOutputDevice, PWMOutputDevice
 
 
 class GPIO(ABC):
+    __slots__ = ('pin', 'label', 'pin_factory', '_device')
     def_pin_factory = PiGPIOFactory()
     
     def __init__(
@@ -29,7 +32,8 @@ class GPIO(ABC):
 
 
 class DigitalInput(GPIO):
-        
+    __slots__ = ()
+    
     def __init__(
         self, 
         pin: int,
@@ -90,6 +94,7 @@ class DigitalInput(GPIO):
 
 
 class DigitalOutput(GPIO):
+    __slots__ = ('initial_value', 'active_high', '_trigger', 'set_high', 'set_low')
     
     def __init__(
         self,
@@ -125,12 +130,30 @@ class DigitalOutput(GPIO):
         """
         super().__init__(pin, label, pin_factory)
         self.initial_value = initial_value
+        self.active_high = active_high
         self._device = DigitalOutputDevice(
             self.pin, 
             active_high=active_high,
             initial_value=initial_value,
             pin_factory=self.pin_factory
         )
+        # With the pigpio daemon, a short pulse can be generated by the daemon
+        # itself with a single trigger command.
+        if isinstance(self.pin_factory, PiGPIOFactory) and isinstance(pin, int):
+            self._trigger = self.pin_factory.connection.gpio_trigger
+        else:
+            self._trigger = None
+        # Functions without arguments that activate or deactivate the output.
+        # They are bound once here, so that code writing the output at a high
+        # rate doesn't need to go through `write()` each time.
+        if self._trigger is not None:
+            level = int(active_high)
+            gpio_write = self.pin_factory.connection.write
+            self.set_high = partial(gpio_write, pin, level)
+            self.set_low = partial(gpio_write, pin, 1 - level)
+        else:
+            self.set_high = self._device.on
+            self.set_low = self._device.off
     
     def read(self) -> bool | int:
         return self._device.value
@@ -142,8 +165,37 @@ class DigitalOutput(GPIO):
         except:
             raise ValueError("Value must be `bool` or`int`.")
 
+    def pulse(self, width: float) -> None:
+        """Activates the output during `width` seconds and deactivates it 
+        again.
+        
+        If the output is driven through the `pigpio` daemon and the pulse 
+        width is between 1 and 100 µs, the complete pulse is generated by the
+        daemon with a single trigger command. Otherwise, the output is written
+        twice. Pulses shorter than 1 ms are then timed by busy-waiting, as 
+        `time.sleep()` cannot wake up reliably within such a short time.
+        """
+        width_us = round(width * 1e6)
+        if self._trigger is not None and 1 <= width_us <= 100:
+            self._trigger(self.pin, width_us, int(self.active_high))
+        elif width < 1e-3:
+            clock = time.perf_counter_ns
+            self.set_high()
+            t_end = clock() + int(width * 1e9)
+            while clock() < t_end:
+                pass
+            self.set_low()
+        else:
+            self.set_high()
+            time.sleep(width)
+            self.set_low()
+
 
 class PWMOutput(GPIO):
+    __slots__ = (
+        'initial_value', 'frame_width', 'min_pulse_width', 'max_pulse_width',
+        'min_value', 'max_value', 'value_range', 'dc_range', 'min_dc'
+    )
 
     def __init__(
         self,
@@ -129,21 +129,33 @@ class MotionProfile(ABC):
 
         # Use case 1 - Determine total travel time.
         # Given: v_m, a_m, and ds_tot.
-        if all([self.v_m, self.a_m, self.ds_tot]):
+        if (
+            self.v_m is not None
+            and self.a_m is not None
+            and self.ds_tot is not None
+        ):
             self._calc_total_travel_time()
         
         # Use case 2 - Determine total travel distance.
         # Given: v_m, a_m, and dt_tot. 
-        elif all([self.v_m, self.a_m, self.dt_tot]):
+        elif (
+            self.v_m is not None
+            and self.a_m is not None
+            and self.dt_tot is not None
+        ):
             self._calc_total_travel_distance()
         
         # Use case 3 - Determine required acceleration.
-        elif all([self.dt_acc, self.dt_tot, self.ds_tot]):
+        elif (
+            self.dt_acc is not None
+            and self.dt_tot is not None
+            and self.ds_tot is not None
+        ):
             self._calc_required_acceleration()
         
         # Use case 4 - Determine minimum acceleration and corresponding top 
         # velocity. Given: ds_tot, dt_tot (no constant velocity region)
-        elif all([self.dt_tot, self.ds_tot]):
+        elif self.dt_tot is not None and self.ds_tot is not None:
             self._calc_minimum_acceleration()
         
         else:
@@ -172,6 +184,14 @@ class MotionProfile(ABC):
     def _calc_accel(self) -> float:
         ...
 
+    @abstractmethod
+    def _accel_position(self, t: np.ndarray) -> np.ndarray:
+        ...
+
+    @abstractmethod
+    def _accel_time(self, s: np.ndarray) -> np.ndarray:
+        ...
+
     def _calc_total_travel_time(self) -> None:
         # acceleration phase
         self.ds_acc = self._calc_accel_distance()
@@ -214,7 +234,8 @@ class MotionProfile(ABC):
 
     def _calc_minimum_acceleration(self) -> None:
         self.v_m = 2 * self.ds_tot / self.dt_tot
-        self.a_m = 2 * self.v_m / self.dt_tot
+        self.dt_acc = self.dt_tot / 2
+        self.a_m = self._calc_accel()
         
         # acceleration phase
         self.ds_acc = self._calc_accel_distance()
@@ -237,13 +258,7 @@ class MotionProfile(ABC):
         self.a_m = self._calc_accel()
 
     def _calc_accel_distance(self) -> float:
-        t0 = 0.0
-        t1 = t0 + self.dt_acc
-        v0 = 0.0
-        s0 = 0.0
-        _, s, _ = position(t1, self._accel_fun, t0, v0, s0)
-        s1 = float(s[-1])
-        ds_acc = s1 - s0
+        ds_acc = float(self._accel_position(self.dt_acc))
         return ds_acc
 
     def _calc_cst_veloc_duration(self) -> float:
@@ -271,8 +286,10 @@ class MotionProfile(ABC):
         t1, v1 = float(t1_arr[-1]), float(v1_arr[-1])
         t2 = t1 + self.dt_cov
         if t2 > t1:
-            t2_arr, v2_arr = velocity(t2, lambda t: 0.0, t1, v1)
-            t2, v2 = float(t2_arr[-1]), float(v2_arr[-1])
+            # no acceleration: velocity stays constant
+            t2_arr = np.linspace(t1, t2)
+            v2_arr = np.full_like(t2_arr, v1)
+            t2, v2 = float(t2_arr[-1]), v1
         else:
             t2_arr, v2_arr = None, None
             t2, v2 = float(t1_arr[-1]), float(v1_arr[-1])
@@ -310,8 +327,11 @@ class MotionProfile(ABC):
         t1, v1, s1 = float(t1_arr[-1]), float(v1_arr[-1]), float(s1_arr[-1])
         t2 = t1 + self.dt_cov
         if t2 > t1:
-            t2_arr, s2_arr, v2_arr = position(t2, lambda t: 0.0, t1, v1, s1)
-            t2, v2, s2 = float(t2_arr[-1]), float(v2_arr[-1]), float(s2_arr[-1])
+            # no acceleration: position increases linearly with time
+            t2_arr = np.linspace(t1, t2)
+            s2_arr = s1 + v1 * (t2_arr - t1)
+            v2_arr = np.full_like(t2_arr, v1)
+            t2, v2, s2 = float(t2_arr[-1]), v1, float(s2_arr[-1])
         else:
             t2_arr, s2_arr, v2_arr = None, None, None
             t2, v2, s2 = float(t1_arr[-1]), float(v1_arr[-1]), float(s1_arr[-1])
@@ -351,7 +371,7 @@ class MotionProfile(ABC):
         t2 = t1 + self.dt_cov
         if t2 > t1:
             t2_arr = np.linspace(t1, t2, endpoint=True)
-            a2_arr = np.array([0.0 for _ in t2_arr])
+            a2_arr = np.zeros_like(t2_arr)
             t2, a2 = float(t2_arr[-1]), float(a2_arr[-1])
         else:
             t2_arr = None
@@ -369,12 +389,76 @@ class MotionProfile(ABC):
             t_arr = np.concatenate((t1_arr, t2_arr, t3_arr))
             
         if a2_arr is None:
-            a_arr = np.concatenate((a1_arr, a2_arr, a3_arr))
+            a_arr = np.concatenate((a1_arr, a3_arr))
         else:
             a_arr = np.concatenate((a1_arr, a2_arr, a3_arr))
             
         return t_arr, a_arr
 
+    def positions_at(self, t_arr: np.ndarray) -> np.ndarray:
+        """Calculates the positions at the time moments in `t_arr` with the
+        closed-form position equations of the motion profile, i.e. without
+        numerical integration.
+
+        Parameters
+        ----------
+        t_arr:
+            Time moments (`0 <= t <= dt_tot`). Time moments outside this range
+            are clipped to the start or the end of the movement.
+
+        Returns
+        -------
+        Numpy array with the positions at the given time moments.
+        """
+        t_dec = self.dt_acc + self.dt_cov
+        t_end = t_dec + self.dt_dec
+        t = np.clip(np.asarray(t_arr, dtype=float), 0.0, t_end)
+        s_acc = self._accel_position(self.dt_acc)
+        s_end = 2 * s_acc + self.v_m * self.dt_cov
+        # Each phase is only evaluated on its own slice of the time moments.
+        m_acc = t <= self.dt_acc
+        m_dec = t > t_dec
+        m_cov = ~(m_acc | m_dec)
+        s = np.empty_like(t)
+        s[m_acc] = self._accel_position(t[m_acc])
+        s[m_cov] = s_acc + self.v_m * (t[m_cov] - self.dt_acc)
+        # The deceleration phase mirrors the acceleration phase.
+        s[m_dec] = s_end - self._accel_position(t_end - t[m_dec])
+        return s
+
+    def times_at(self, s_arr: np.ndarray) -> np.ndarray:
+        """Calculates the time moments at which the positions in `s_arr` are 
+        reached, using the closed-form inverse of the position equations of
+        the motion profile, i.e. without numerical integration or 
+        interpolation.
+
+        Parameters
+        ----------
+        s_arr:
+            Positions (`0 <= s <= ds_tot`). Positions outside this range are
+            clipped to the start or the end of the movement.
+
+        Returns
+        -------
+        Numpy array with the time moments at the given positions.
+        """
+        t_dec = self.dt_acc + self.dt_cov
+        t_end = t_dec + self.dt_dec
+        s_acc = self._accel_position(self.dt_acc)
+        s_dec = s_acc + self.v_m * self.dt_cov
+        s_end = s_dec + s_acc
+        s = np.clip(np.asarray(s_arr, dtype=float), 0.0, s_end)
+        # Each phase is only evaluated on its own slice of the positions.
+        m_acc = s <= s_acc
+        m_dec = s > s_dec
+        m_cov = ~(m_acc | m_dec)
+        t = np.empty_like(s)
+        t[m_acc] = self._accel_time(s[m_acc])
+        t[m_cov] = self.dt_acc + (s[m_cov] - s_acc) / self.v_m
+        # The deceleration phase mirrors the acceleration phase.
+        t[m_dec] = t_end - self._accel_time(s_end - s[m_dec])
+        return t
+
     def get_fn_velocity_from_time(
         self,
         N: float | None = None
@@ -438,6 +522,9 @@ class MotionProfile(ABC):
     ) -> Callable[[float], float]:
         """Returns a function that takes a position `s` and returns the time 
         moment `t` this position is reached in the movement (`0 <= s <= ds_tot`).
+        The function also accepts a Numpy array of positions, in which case
+        a Numpy array of time moments is returned. Positions outside the 
+        range of the movement are mapped to the start or the end time.
 
         Parameters
         ----------
@@ -449,15 +536,14 @@ class MotionProfile(ABC):
         if N is not None:
             s_ax = N * s_ax
                 
-        interp = scipy.interpolate.interp1d(s_ax, t_ax)
+        interp = scipy.interpolate.interp1d(
+            s_ax, t_ax,
+            bounds_error=False,
+            fill_value=(t_ax[0], t_ax[-1])
+        )
 
-        def f(s: float) -> float:
-            try:
-                t = interp(s)
-            except ValueError:
-                # noinspection PyTypeChecker
-                return t_ax[-1]
-            return t
+        def f(s: float | np.ndarray) -> float | np.ndarray:
+            return interp(s)
         
         return f
     
@@ -685,6 +771,12 @@ class TrapezoidalProfile(MotionProfile):
     def _calc_accel(self) -> float:
         return self.v_m / self.dt_acc
 
+    def _accel_position(self, t: np.ndarray) -> np.ndarray:
+        return 0.5 * self.a_m * t ** 2
+
+    def _accel_time(self, s: np.ndarray) -> np.ndarray:
+        return np.sqrt(2 * s / self.a_m)
+
 
 class SCurvedProfile(MotionProfile):
     """
@@ -723,3 +815,41 @@ class SCurvedProfile(MotionProfile):
 
     def _calc_accel(self) -> float:
         return 2 * self.v_m / self.dt_acc
+
+    def _accel_position(self, t: np.ndarray) -> np.ndarray:
+        # The acceleration increases linearly up to `dt_acc / 2` and then 
+        # decreases linearly, so the position is a cubic on both halves.
+        c1 = self.a_m ** 2 / self.v_m
+        t1 = self.dt_acc / 2
+        a1 = c1 * t1
+        v1 = c1 * t1 ** 2 / 2
+        s1 = c1 * t1 ** 3 / 6
+        t = np.asarray(t, dtype=float)
+        m1 = t <= t1
+        s = np.empty_like(t)
+        # Both cubics are evaluated with Horner's scheme.
+        s[m1] = np.polyval([c1 / 6, 0.0, 0.0, 0.0], t[m1])
+        s[~m1] = np.polyval([-c1 / 6, a1 / 2, v1, s1], t[~m1] - t1)
+        return s
+
+    def _accel_time(self, s: np.ndarray) -> np.ndarray:
+        c1 = self.a_m ** 2 / self.v_m
+        t1 = self.dt_acc / 2
+        t2 = self.dt_acc
+        s1 = c1 * t1 ** 3 / 6
+        v2 = c1 * t1 ** 2
+        s2 = self._accel_position(t2)
+        # On the second half, the velocity is point-symmetric to the first
+        # half, so with u = t2 - t the position satisfies the depressed cubic
+        # u**3 + p * u + q = 0, which is solved with the trigonometric method.
+        p = -6 * v2 / c1
+        s = np.asarray(s, dtype=float)
+        m1 = s <= s1
+        t = np.empty_like(s)
+        t[m1] = np.cbrt(6 * s[m1] / c1)
+        q = 6 * (s2 - s[~m1]) / c1
+        r = 2 * np.sqrt(-p / 3)
+        phi = np.arccos(np.clip(3 * q / (2 * p) * np.sqrt(-3 / p), -1.0, 1.0))
+        t[~m1] = t2 - r * np.cos(phi / 3 - 2 * np.pi / 3)
+        return t
+
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 import logging
 import socket
+import selectors
 import json
 import time
 import serial
@@ -14,6 +15,8 @@ class AbstractRemoteDeviceClient(ABC):
     and managing connections to remote devices, regardless of the underlying
     communication protocol (e.g., TCP/IP or serial).
     """
+    # The shutdown command never changes, so it is encoded only once.
+    SHUTDOWN_MSG: bytes = b'{"command":"shutdown"}\n'
 
     @abstractmethod
     def connect(self) -> None:
@@ -47,6 +50,16 @@ class TCPRemoteDeviceClient(AbstractRemoteDeviceClient):
 
     Provides connection management, command sending, and response handling
     over a TCP/IP socket with JSON-formatted messages.
+
+    Each message, in either direction, is a single line of JSON terminated by
+    a newline ('\n'). The remote device must therefore split the received
+    data on newlines: when commands are batched (see `auto_flush`), several
+    commands can arrive in a single TCP segment.
+
+    The remote device must answer each command with exactly one final
+    response, having either 'status': 'done' or 'status': 'error'. Any other
+    responses (e.g. 'status': 'started') may precede it and are skipped by
+    `wait_for_done()`.
     """
 
     def __init__(
@@ -56,7 +69,8 @@ class TCPRemoteDeviceClient(AbstractRemoteDeviceClient):
         logger: logging.Logger | None = None,
         timeout: float = 5,
         max_retries: int = 3,
-        retry_delay: float = 2
+        retry_delay: float = 2,
+        auto_flush: bool = True
     ) -> None:
         """
         Initializes the TCP remote device client.
@@ -75,6 +89,12 @@ class TCPRemoteDeviceClient(AbstractRemoteDeviceClient):
             Number of retries if connection fails.
         retry_delay : float
             Delay in seconds between retry attempts.
+        auto_flush : bool
+            If True (default), each command is sent immediately. If False,
+            commands are buffered until `flush()` or `wait_for_done()` is
+            called, so that a batch of commands is sent at once. 
+            `wait_for_done()` then waits for the final response to each
+            command of the batch.
         """
         self.host: str = host
         self.port: int = port
@@ -83,7 +103,16 @@ class TCPRemoteDeviceClient(AbstractRemoteDeviceClient):
         self.max_retries: int = max_retries
         self.retry_delay: float = retry_delay
         self.socket:socket.socket | None = None
-        self.stream: socket.SocketIO | None = None
+        self.auto_flush: bool = auto_flush
+        self._encode = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+        self._out_buf = bytearray()
+        # Receive buffer that is reused for all responses: `_rx_len` bytes at
+        # the start of the buffer have been received, but not yet processed.
+        self._rx_buf = bytearray(65536)
+        self._rx_len = 0
+        self._selector: selectors.BaseSelector | None = None
+        # Number of commands that have been sent, but not answered yet.
+        self._n_pending = 0
 
     def connect(self) -> None:
         """Establishes a TCP connection to the remote device with retry logic."""
@@ -93,8 +122,12 @@ class TCPRemoteDeviceClient(AbstractRemoteDeviceClient):
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 self.socket.settimeout(self.timeout)
                 self.socket.connect((self.host, self.port))
-                self.stream = self.socket.makefile('r')
                 self.socket.settimeout(None)
+                self._out_buf.clear()
+                self._rx_len = 0
+                self._n_pending = 0
+                self._selector = selectors.DefaultSelector()
+                self._selector.register(self.socket, selectors.EVENT_READ)
                 self._log(f"Connected to device at {self.host}:{self.port}")
                 return
             except Exception as e:
@@ -105,8 +138,21 @@ class TCPRemoteDeviceClient(AbstractRemoteDeviceClient):
 
     def send_command(self, command_dict: dict) -> None:
         """Sends a JSON-encoded command to the remote device."""
-        msg = json.dumps(command_dict) + "\n"
-        self.socket.sendall(msg.encode())
+        self._out_buf += self._encode(command_dict).encode()
+        self._out_buf += b"\n"
+        if self.auto_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Sends the buffered commands to the remote device."""
+        if self._out_buf:
+            # The buffer is also cleared if sending fails, so that the
+            # commands are never replayed on a later connection.
+            try:
+                self.socket.sendall(self._out_buf)
+                self._n_pending += self._out_buf.count(b"\n")
+            finally:
+                self._out_buf.clear()
 
     def wait_for_done(self) -> None:
         """
@@ -114,30 +160,69 @@ class TCPRemoteDeviceClient(AbstractRemoteDeviceClient):
 
         Expects a JSON message with 'status': 'done' to confirm completion.
         Raises an error if 'status': 'error' or timeout occurs.
+
+        If several commands have been sent since the previous call (see 
+        `auto_flush`), the final response to each of them is awaited, so that
+        the responses to these commands cannot be taken for the responses to
+        later commands. The timeout applies to each response separately.
         """
-        start_time = time.time()
+        self.flush()
         while True:
-            if time.time() - start_time > self.timeout:
+            deadline = time.monotonic() + self.timeout
+            while True:
+                response = json.loads(self._read_line(deadline))
+                status = response.get("status")
+                if status == "done" or status == "error":
+                    break
+            self._n_pending = max(self._n_pending - 1, 0)
+            if status == "error":
+                raise RuntimeError(f"Error from remote device: {response.get('message')}")
+            if self._n_pending == 0:
+                return
+
+    def _read_line(self, deadline: float) -> bytes:
+        """Returns the next newline-terminated message from the remote device
+        (without the newline), receiving data into the receive buffer until
+        a complete message is available.
+
+        Raises a `TimeoutError` if no complete message has been received 
+        before `deadline` (a time moment of `time.monotonic()`).
+        """
+        while True:
+            idx = self._rx_buf.find(b"\n", 0, self._rx_len)
+            if idx >= 0:
+                line = bytes(self._rx_buf[:idx])
+                rest = self._rx_len - idx - 1
+                self._rx_buf[:rest] = self._rx_buf[idx + 1:self._rx_len]
+                self._rx_len = rest
+                return line
+            if self._rx_len == len(self._rx_buf):
+                self._rx_buf.extend(bytes(len(self._rx_buf)))
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._selector.select(remaining):
                 raise TimeoutError("Timed out waiting for response from remote device.")
-            line = self.stream.readline()
-            if not line:
+            with memoryview(self._rx_buf) as view:
+                n = self.socket.recv_into(view[self._rx_len:])
+            if n == 0:
                 raise ConnectionError("Connection to remote device was closed unexpectedly.")
-            response = json.loads(line)
-            if response.get("status") == "done":
-                return
-            elif response.get("status") == "error":
-                raise RuntimeError(f"Error from remote device: {response.get('message')}")
+            self._rx_len += n
 
     def shutdown(self) -> None:
         """Sends a shutdown command to the remote device."""
         try:
-            self.send_command({"command": "shutdown"})
+            self._out_buf += self.SHUTDOWN_MSG
+            self.flush()
         except:
             self._log("Failed to send shutdown command.", level=logging.ERROR)
 
     def close(self) -> None:
         """Closes the TCP socket connection."""
+        self._out_buf.clear()
+        self._rx_len = 0
+        self._n_pending = 0
         try:
+            if self._selector:
+                self._selector.close()
             if self.socket:
                 self.socket.close()
         except:
@@ -233,7 +318,7 @@ class SerialRemoteDeviceClient(AbstractRemoteDeviceClient):
     def shutdown(self) -> None:
         """Sends a shutdown command to the serial device."""
         try:
-            self.send_command({"command": "shutdown"})
+            self.ser.write(self.SHUTDOWN_MSG)
         except:
             self._log("Failed to send shutdown command.", level=logging.ERROR)
 
@@ -7,10 +7,12 @@ from pyberryplc.stepper.driver.base import StepperMotor
 from pyberryplc.stepper.driver.a4988 import A4988StepperMotor
 from pyberryplc.stepper.driver.tmc2208 import TMC2208StepperMotor
 from pyberryplc.stepper.uart.tmc2208_uart import TMC2208UART
+from pyberryplc.stepper.uart.tmc2208_uart_async import TMC2208UARTAsync
 
 __all__ = [
     "StepperMotor",
     "A4988StepperMotor",
     "TMC2208StepperMotor",
     "TMC2208UART",
+    "TMC2208UARTAsync",
 ]
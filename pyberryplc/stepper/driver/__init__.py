@@ -5,9 +5,11 @@ GPIO-based stepper motor implementations and speed profiles.
 from pyberryplc.stepper.driver.base import StepperMotor
 from pyberryplc.stepper.driver.a4988 import A4988StepperMotor
 from pyberryplc.stepper.driver.tmc2208 import TMC2208StepperMotor
+from pyberryplc.stepper.driver.pulse_train import PulseTrain
 
 __all__ = [
     "StepperMotor",
     "A4988StepperMotor",
     "TMC2208StepperMotor",
+    "PulseTrain",
 ]
@@ -8,6 +8,7 @@ class A4988StepperMotor(StepperMotor):
     Stepper motor controlled via an A4988 driver and GPIO.
     Supports microstepping configuration via MS1, MS2, and MS3 pins.
     """
+    __slots__ = ('ms1', 'ms2', 'ms3')
 
     MICROSTEP_CONFIG_GPIO: dict[str, tuple[int, int, int]] = {
         "full":  (0, 0, 0),
@@ -78,7 +79,7 @@ class A4988StepperMotor(StepperMotor):
             logger
         )
     
-    def _validate_microstepping(self, microstep_resolution: str) -> int:
+    def _validate_microstepping(self, microstep_resolution: str) -> tuple[str, int]:
         """
         Checks whether the microstep resolution is valid for the A4988 driver. 
         
@@ -95,15 +96,13 @@ class A4988StepperMotor(StepperMotor):
         ValueError :
             If the microstep resolution is unavailable on the A4988 driver.
         """
-        valid_resolutions = list(self.MICROSTEP_CONFIG_GPIO.keys())
-        if microstep_resolution in valid_resolutions:
-            return self.MICROSTEP_FACTORS[microstep_resolution]
-        else:
+        if microstep_resolution not in self.MICROSTEP_CONFIG_GPIO:
             raise ValueError(
                 f"Microstep resolution '{microstep_resolution}' is "
                 f"unavailable on this driver. "
-                f"Available: {valid_resolutions}"
+                f"Available: {list(self.MICROSTEP_CONFIG_GPIO)}"
             )
+        return microstep_resolution, self.MICROSTEP_FACTORS[microstep_resolution]
     
     def set_microstepping(self) -> None:
         """
@@ -30,6 +30,8 @@ The base class also handles:
 - Step pulse generation (including pulse width)
 - GPIO-based direction and enable control
 - Step timing using monotonic timestamps
+- Optional DMA-timed step pulses with pigpio waveforms (`use_pulse_train`)
+- Optional real-time scheduling of blocking rotations (`use_realtime`)
 
 Non-blocking motion execution must be driven by periodic calls to 
 `do_single_step()` from a PLC scan cycle or real-time loop.
@@ -40,11 +42,18 @@ This class is intended to be subclassed by concrete driver implementations
 
 import time
 import logging
+import threading
 from abc import ABC, abstractmethod
-from collections import deque
+from collections import OrderedDict
+from collections.abc import Iterable
+from itertools import chain, repeat
+
+import numpy as np
 
 from pyberryplc.core.gpio import DigitalOutput
 from pyberryplc.motion_profiles import MotionProfile, DynamicDelayGenerator
+from pyberryplc.stepper.driver.pulse_train import PulseTrain
+from pyberryplc.utils.realtime import enter_realtime
 
 
 class StepperMotor(ABC):
@@ -55,6 +64,17 @@ class StepperMotor(ABC):
     This class provides the common foundation for implementing stepper motor 
     drivers.
     """
+    __slots__ = (
+        'step', 'dir', '_enable', 'full_steps_per_rev', 'microstep_resolution',
+        'microstep_factor', 'steps_per_degree', 'step_angle', 'step_width', 'spin_time',
+        'logger', '_busy', '_next_step_time_ns', '_step_times_ns', 
+        '_const_delay_ns', '_step_idx', '_n_steps', '_dynamic_generator', 
+        '_profile_delays', '_pulse_train', '_realtime', '_realtime_thread'
+    )
+    
+    # Maximum number of motion profiles of which the delays are kept.
+    PROFILE_CACHE_SIZE: int = 64
+
     MICROSTEP_FACTORS: dict[str, int] = {
         "full": 1,
         "1/2": 2,
@@ -110,16 +130,40 @@ class StepperMotor(ABC):
         res = self._validate_microstepping(microstep_resolution)
         self.microstep_resolution = res[0]
         self.microstep_factor = res[1]
+        # Number of steps per degree of rotation and the rotation angle in 
+        # degrees that corresponds with a single step pulse.
+        self.steps_per_degree = self.full_steps_per_rev * self.microstep_factor / 360
+        self.step_angle = 1 / self.steps_per_degree
         self.logger = logger or logging.getLogger(__name__)
         self.step_width = 10e-6  # time duration (sec) of single step pulse
+        # Final part of the wait for a step (sec) that blocking rotations 
+        # busy-wait instead of sleep, as the wake-up of `time.sleep()` can be 
+        # late by tens of microseconds.
+        self.spin_time = 100e-6
 
         # State for non-blocking motion control
         self._busy = False
-        self._next_step_time = 0.0
-        self._delays = deque()
+        self._next_step_time_ns = 0
+        self._step_times_ns: np.ndarray | None = None
+        self._const_delay_ns = 0
+        self._step_idx = 0
+        self._n_steps = 0
         
         self._dynamic_generator = None
 
+        # Delays of the most recently used static motion profiles, reused 
+        # when the same rotation is repeated.
+        self._profile_delays: OrderedDict[tuple, np.ndarray] = OrderedDict()
+
+        # Optional pigpio pulse train that takes over the generation of the 
+        # step pulses of the static non-blocking rotations.
+        self._pulse_train: PulseTrain | None = None
+
+        # Optional real-time settings for the thread that runs the blocking 
+        # rotations, and the thread they were last applied to.
+        self._realtime: dict | None = None
+        self._realtime_thread: int | None = None
+
     def enable(self) -> None:
         """Enable the stepper driver (if EN pin is defined)."""
         if self._enable:
@@ -132,6 +176,66 @@ class StepperMotor(ABC):
             self._enable.write(False)
             self.logger.debug("Driver disabled")
 
+    def use_pulse_train(self, enabled: bool = True, chunk_size: int = 1000) -> None:
+        """Let the rotations with a fixed speed or a static motion profile 
+        send their step pulses as pigpio waveforms (see `PulseTrain`), instead
+        of timing each step pulse in Python.
+
+        The steps are then timed by the DMA engine of the Raspberry Pi. With 
+        the non-blocking rotations, `do_single_step()` must still be called in
+        the scan cycle to queue the next chunk of step pulses and to update 
+        the busy state of the motor.
+
+        The pigpio daemon has a single waveform transmitter. Only one motor
+        per pigpio connection (i.e. per Raspberry Pi) can send a pulse train
+        at a time; starting a rotation while the pulse train of another motor
+        is still being sent raises a `RuntimeError`. Use pulse trains for a
+        single axis, and keep the software-timed step pulses for the others.
+
+        Parameters
+        ----------
+        enabled : bool, optional
+            Whether to use a pulse train. Default is True.
+        chunk_size : int, optional
+            Number of step pulses in a single waveform. Default is 1000.
+        """
+        if self._pulse_train is not None:
+            self._pulse_train.stop()
+        if enabled:
+            self._pulse_train = PulseTrain(self.step, self.step_width, chunk_size)
+        else:
+            self._pulse_train = None
+
+    def use_realtime(
+        self, 
+        cpu: int | None = None, 
+        priority: int | None = 80, 
+        lock_memory: bool = True
+    ) -> None:
+        """Run the blocking rotations with real-time settings to reduce the 
+        scheduling jitter of the step pulses (see `enter_realtime()` in 
+        `pyberryplc.utils.realtime`).
+
+        The settings are applied to the thread that calls a blocking rotation
+        method, the first time it does so, and remain in effect for that 
+        thread afterwards.
+
+        Parameters
+        ----------
+        cpu : int | None, optional
+            CPU core to pin the thread to, preferably a core that is isolated
+            with the `isolcpus` kernel boot argument. If None (default), the 
+            CPU affinity is left unchanged.
+        priority : int | None, optional
+            SCHED_FIFO real-time priority (1-99). Default is 80. If None, the 
+            scheduling policy is left unchanged.
+        lock_memory : bool, optional
+            Whether to lock the memory of the process into RAM. Default is 
+            True.
+        """
+        self._realtime = dict(cpu=cpu, priority=priority, lock_memory=lock_memory)
+        self._realtime_thread = None
+
     @property
     def busy(self) -> bool:
         """Return whether the motor is currently executing a motion."""
@@ -157,18 +261,6 @@ class StepperMotor(ABC):
         """
         pass
 
-    @property
-    def steps_per_degree(self) -> float:
-        """Return the number of steps per degree of rotation."""
-        return self.full_steps_per_rev * self.microstep_factor / 360
-
-    @property
-    def step_angle(self) -> float:
-        """Return the rotation angle in degrees that corresponds with a single 
-        step pulse.
-        """
-        return 1 / self.steps_per_degree
-
     @abstractmethod
     def set_microstepping(self) -> None:
         """
@@ -192,14 +284,15 @@ class StepperMotor(ABC):
             Constant speed in degrees per second.
         direction : str, optional
             Either "forward" or "backward". Default is "forward".
+
+        Raises
+        ------
+        ValueError
+            If the angle is negative or the angular speed is not positive.
         """
+        delay, total_steps = self._get_fixed_delay(angle, angular_speed)
         self._set_direction(direction)
-        total_steps = int(angle * self.steps_per_degree)
-        delay = 1.0 / (angular_speed * self.steps_per_degree) - self.step_width
-
-        for _ in range(total_steps):
-            self._pulse_step_pin()
-            time.sleep(delay)
+        self._run_delays(repeat(delay, total_steps))
 
     def rotate_profile(
         self, 
@@ -217,18 +310,7 @@ class StepperMotor(ABC):
             Either "forward" or "backward". Default is "forward".
         """
         self._set_direction(direction)
-        start_angle = 0.0
-        final_angle = profile.ds_tot + self.step_angle
-        angles = [
-            start_angle + i * self.step_angle 
-            for i in range(int(final_angle / self.step_angle))
-        ]
-        times = list(map(profile.get_fn_time_from_position(), angles))
-        delays = [t2 - t1 - self.step_width for t1, t2 in zip(times, times[1:])]
-
-        for delay in delays:
-            self._pulse_step_pin()
-            time.sleep(delay)
+        self._run_delays(self._get_delays(profile).tolist())
 
     def rotate_dynamic(
         self, 
@@ -247,13 +329,14 @@ class StepperMotor(ABC):
         direction : str, optional
             Either "forward" or "backward". Default is "forward".
         """
+        self._enter_realtime()
         self._set_direction(direction)
-        try:
-            while True:
-                self._pulse_step_pin()
-                time.sleep(generator.next_delay() - self.step_width)
-        except StopIteration:
-            return
+        # The delays are not known in advance, so they cannot be sent as a 
+        # pulse train; `next_delay()` raises StopIteration when the motion is
+        # complete, which ends the iteration. As in `do_single_step_dynamic()`,
+        # a pulse is also generated before the generator reports the end of
+        # the motion, hence the final zero delay.
+        self._step_loop(chain(iter(generator.next_delay, None), (0.0,)))
 
     def start_rotation_fixed(
         self, 
@@ -273,13 +356,15 @@ class StepperMotor(ABC):
             Constant angular speed in degrees per second.
         direction : str, optional
             Either "forward" or "backward". Default is "forward".
+
+        Raises
+        ------
+        ValueError
+            If the angle is negative or the angular speed is not positive.
         """
+        delay, total_steps = self._get_fixed_delay(angle, angular_speed)
         self._set_direction(direction)
-        total_steps = int(angle * self.steps_per_degree)
-        delay = 1.0 / (angular_speed * self.steps_per_degree) - self.step_width
-        self._delays = deque([delay] * total_steps)
-        self._busy = True
-        self._next_step_time = time.time()
+        self._start_delays(delay, total_steps)
 
     def start_rotation_profile(
         self, 
@@ -298,17 +383,7 @@ class StepperMotor(ABC):
             Either "forward" or "backward". Default is "forward".
         """
         self._set_direction(direction)
-        start_angle = 0.0
-        final_angle = profile.ds_tot + self.step_angle
-        angles = [
-            start_angle + i * self.step_angle 
-            for i in range(int(final_angle / self.step_angle))
-        ]
-        times = list(map(profile.get_fn_time_from_position(), angles))
-        delays = [t2 - t1 - self.step_width for t1, t2 in zip(times, times[1:])]
-        self._delays = deque(delays)
-        self._busy = True
-        self._next_step_time = time.time()
+        self._start_delays(self._get_delays(profile))
 
     def start_rotation_dynamic(
         self, 
@@ -328,9 +403,11 @@ class StepperMotor(ABC):
         """
         self._set_direction(direction)
         self._dynamic_generator = generator
-        self._delays = None
+        self._step_times_ns = None
+        self._step_idx = 0
+        self._n_steps = 0
         self._busy = True
-        self._next_step_time = time.time()
+        self._next_step_time_ns = time.monotonic_ns()
 
     def do_single_step_dynamic(self) -> None:
         """Perform one step of a dynamic non-blocking motion if timing is right.
@@ -340,12 +417,12 @@ class StepperMotor(ABC):
         if not self._busy or not hasattr(self, '_dynamic_generator'):
             return
 
-        now = time.time()
-        if now >= self._next_step_time:
+        now_ns = time.monotonic_ns()
+        if now_ns >= self._next_step_time_ns:
             try:
                 self._pulse_step_pin()
-                delay = self._dynamic_generator.next_delay() - self.step_width
-                self._next_step_time = now + delay
+                delay = self._dynamic_generator.next_delay()
+                self._next_step_time_ns = now_ns + int(delay * 1e9)
             except StopIteration:
                 self.logger.info("Motion complete.")
                 self._busy = False
@@ -359,22 +436,192 @@ class StepperMotor(ABC):
         if not self._busy:
             return
 
-        if hasattr(self, '_dynamic_generator') and self._dynamic_generator:
+        if self._dynamic_generator is not None:
             self.do_single_step_dynamic()
             return
 
-        now = time.time()
-        if now >= self._next_step_time and self._delays:
-            self._pulse_step_pin()
-            self._next_step_time = now + self._delays.popleft()
-            if not self._delays:
-                self._busy = False
+        if self._pulse_train is not None:
+            self._busy = self._pulse_train.update()
+            return
+
+        # This is called in every scan cycle: read each attribute only once.
+        idx = self._step_idx
+        n_steps = self._n_steps
+        if idx >= n_steps:
+            self._busy = False
+            return
+
+        step_times_ns = self._step_times_ns
+        if step_times_ns is None:
+            due_ns = self._next_step_time_ns
+        else:
+            due_ns = step_times_ns[idx]
+        if time.monotonic_ns() < due_ns:
+            return
+        
+        self._pulse_step_pin()
+        if step_times_ns is None:
+            self._next_step_time_ns = due_ns + self._const_delay_ns
+        idx += 1
+        self._step_idx = idx
+        if idx == n_steps:
+            self._busy = False
+
+    def _run_delays(self, delays: Iterable[float]) -> None:
+        """Blocking step loop: generate a step pulse for each delay (in seconds)
+        in `delays` and wait until the delay since the start of the pulse has 
+        elapsed.
+
+        Each step is scheduled on an absolute deadline of the monotonic clock,
+        so the time spent on generating the pulse is compensated for instead 
+        of accumulating over the movement. The thread sleeps until `spin_time`
+        before the deadline, which releases the GIL, so motors that are run 
+        from separate threads do not hold each other up. The remaining time 
+        is busy-waited, so that the step is not delayed by the wake-up latency
+        of `time.sleep()`.
+
+        If a pulse train is used (see `use_pulse_train()`), the step pulses are
+        timed by the DMA engine instead, and this method only waits until the 
+        pulse train has been sent.
+        """
+        self._enter_realtime()
+        if self._pulse_train is not None:
+            pulse_train = self._pulse_train
+            pulse_train.start(np.fromiter(delays, dtype=float))
+            try:
+                # A chunk of the pulse train takes much longer than a 
+                # millisecond, so the next chunk is always queued in time.
+                while pulse_train.update():
+                    time.sleep(0.001)
+            finally:
+                # Releases the waveform transmitter if the wait is aborted.
+                pulse_train.stop()
+        else:
+            self._step_loop(delays)
+
+    def _step_loop(self, delays: Iterable[float]) -> None:
+        """Generate a step pulse for each delay (in seconds) in `delays`, timed
+        in Python on absolute deadlines (see `_run_delays()`).
+        """
+        pulse = self._pulse_step_pin
+        sleep = time.sleep
+        clock = time.monotonic
+        spin_time = self.spin_time
+        deadline = clock()
+        for delay in delays:
+            pulse()
+            deadline += delay
+            remaining = deadline - clock()
+            if remaining > spin_time:
+                sleep(remaining - spin_time)
+            while clock() < deadline:
+                pass
+
+    def _enter_realtime(self) -> None:
+        """Apply the real-time settings of `use_realtime()` to the calling 
+        thread, if this hasn't been done yet.
+        """
+        if self._realtime is None:
+            return
+        thread = threading.get_ident()
+        if thread != self._realtime_thread:
+            enter_realtime(**self._realtime, logger=self.logger)
+            self._realtime_thread = thread
+
+    def _start_delays(
+        self, 
+        delays: np.ndarray | float, 
+        n_steps: int | None = None
+    ) -> None:
+        """Prepare a non-blocking motion that steps through the delays 
+        `delays` (in seconds) by advancing an index, one step per pulse.
+
+        `delays` is either an array with the delay of each step, or a single
+        delay that applies to all `n_steps` steps, in which case no array is
+        built. 
+        
+        The steps are scheduled on absolute time moments of the monotonic 
+        clock (in integer nanoseconds), measured from the start of the motion.
+        For an array of delays, the time moments of all steps are computed 
+        up front, so a late call of `do_single_step()` does not shift the 
+        remaining steps.
+        """
+        if self._pulse_train is not None:
+            if not isinstance(delays, np.ndarray):
+                delays = np.full(n_steps, delays)
+            self._pulse_train.start(delays)
+            self._busy = True
+            return
+        start_ns = time.monotonic_ns()
+        if isinstance(delays, np.ndarray):
+            # Rounding the time moments of the steps, instead of the delays 
+            # themselves, prevents the rounding errors from accumulating over
+            # the movement.
+            self._step_times_ns = start_ns + np.rint(
+                np.concatenate(([0.0], np.cumsum(delays[:-1]))) * 1e9
+            ).astype(np.int64)
+            self._n_steps = delays.shape[0]
+        else:
+            self._step_times_ns = None
+            self._const_delay_ns = round(delays * 1e9)
+            self._n_steps = n_steps
+        self._step_idx = 0
+        self._busy = True
+        self._next_step_time_ns = start_ns
+
+    def _get_fixed_delay(self, angle: float, angular_speed: float) -> tuple[float, int]:
+        """Returns the delay (in seconds) between the steps and the number of 
+        steps of a fixed-angle rotation at constant speed.
+
+        Raises
+        ------
+        ValueError
+            If the angle is negative or the angular speed is not positive.
+        """
+        if angle < 0:
+            raise ValueError("The rotation angle cannot be negative.")
+        if angular_speed <= 0:
+            raise ValueError("The angular speed must be greater than zero.")
+        total_steps = int(angle * self.steps_per_degree)
+        delay = 1.0 / (angular_speed * self.steps_per_degree)
+        return delay, total_steps
+
+    def _get_delays(self, profile: MotionProfile) -> np.ndarray:
+        """Return the delays between successive step pulses for a rotation 
+        according to the static motion profile `profile`. 
+        
+        A delay is the time from the start of a step pulse to the start of 
+        the next one (the pulse width is not subtracted). The time moments at
+        which the step angles are reached are calculated with the closed-form
+        equations of the motion profile on the whole array of step angles at
+        once. The results of the last `PROFILE_CACHE_SIZE` motion profiles are
+        kept, so that repeating the same rotations (e.g. back and forth, or a 
+        sequence of moves) does not need to recalculate the motion profile. 
+        The returned array is read-only.
+        """
+        key = (
+            type(profile), profile.v_m, profile.a_m, profile.ds_tot, 
+            profile.dt_tot, profile.dt_acc, self.step_angle
+        )
+        cache = self._profile_delays
+        delays = cache.get(key)
+        if delays is not None:
+            cache.move_to_end(key)
+            return delays
+        
+        total_steps = int(round(profile.ds_tot * self.steps_per_degree))
+        angles = np.linspace(0.0, total_steps * self.step_angle, total_steps + 1)
+        times = profile.times_at(angles)
+        delays = np.diff(times)
+        delays.flags.writeable = False
+        cache[key] = delays
+        if len(cache) > self.PROFILE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return delays
 
     def _pulse_step_pin(self) -> None:
         """Generate a single pulse on the STEP pin."""
-        self.step.write(True)
-        time.sleep(self.step_width)
-        self.step.write(False)
+        self.step.pulse(self.step_width)
 
     def _set_direction(self, direction: str) -> None:
         """Set the motor direction pin.
@@ -0,0 +1,144 @@
+import numpy as np
+import pigpio
+from gpiozero.pins.pigpio import PiGPIOFactory
+
+from pyberryplc.core.gpio import DigitalOutput
+
+
+class PulseTrain:
+    """
+    Generates a train of step pulses on a digital output with the waveforms
+    of the pigpio daemon.
+
+    The pulses are timed by the DMA engine of the Raspberry Pi, not by the
+    Python process, so the timing of the steps does not depend on the scan
+    cycle of the PLC program or on the scheduling jitter of Linux.
+
+    The pigpio daemon can only hold a limited number of pulses in its
+    waveforms. Therefore, the step pulses are split into chunks. Each chunk
+    becomes a separate waveform, which is queued behind the waveform being
+    transmitted. Method `update()` must be called regularly (e.g. in each scan
+    cycle) to queue the next chunk before the current one has been sent.
+
+    The pigpio daemon has only one waveform transmitter, so a pulse train
+    takes all of it: stopping, sending and polling a waveform act on the
+    daemon as a whole. Therefore, only one pulse train can be active on a 
+    pigpio connection at a time, i.e. only one motor (axis) at a time can 
+    use pulse trains on the same Raspberry Pi.
+    """
+    # Active pulse train of each pigpio connection.
+    _active: dict[object, "PulseTrain"] = {}
+
+    def __init__(
+        self,
+        output: DigitalOutput,
+        pulse_width: float = 10e-6,
+        chunk_size: int = 1000
+    ) -> None:
+        """
+        Initialize the PulseTrain instance.
+
+        Parameters
+        ----------
+        output : DigitalOutput
+            Digital output connected to the STEP input of the driver. The
+            output must use the `PiGPIOFactory` pin factory and be specified
+            by its GPIO number.
+        pulse_width : float, optional
+            Time duration (sec) of a single step pulse. Default is 10 µs.
+        chunk_size : int, optional
+            Number of step pulses in a single waveform. Default is 1000.
+
+        Raises
+        ------
+        ValueError
+            If the output is not driven by the pigpio daemon.
+        """
+        if not isinstance(output.pin_factory, PiGPIOFactory):
+            raise ValueError("Pulse trains require the PiGPIOFactory pin factory.")
+        if not isinstance(output.pin, int):
+            raise ValueError("Pulse trains require a GPIO number as pin.")
+        self._pi = output.pin_factory.connection
+        self._mask = 1 << output.pin
+        self.pulse_width_us = max(1, int(round(pulse_width * 1e6)))
+        self.chunk_size = chunk_size
+
+        self._delays_us: np.ndarray | None = None
+        self._idx = 0
+        self._wave_ids: list[int] = []
+
+    def start(self, delays: np.ndarray) -> None:
+        """
+        Start sending a step pulse for each delay (in seconds) in `delays`.
+        A delay is the time between the start of a step pulse and the start
+        of the next one.
+
+        Raises
+        ------
+        RuntimeError
+            If another pulse train is active on the same pigpio connection.
+        """
+        active = PulseTrain._active.get(self._pi)
+        if active is not None and active is not self:
+            raise RuntimeError(
+                "Another pulse train is active on this pigpio connection; "
+                "the pigpio daemon can send only one pulse train at a time."
+            )
+        self.stop()
+        PulseTrain._active[self._pi] = self
+        # Rounding the time moments of the steps, instead of the delays
+        # themselves, to whole microseconds prevents the rounding errors from
+        # accumulating over the movement.
+        t_us = np.rint(np.cumsum(delays) * 1e6).astype(np.int64)
+        self._delays_us = np.diff(t_us, prepend=0)
+        self._idx = 0
+        self._send_next_chunk()
+        self._send_next_chunk()
+
+    def update(self) -> bool:
+        """
+        Queue the next chunk of step pulses as soon as the previous chunk
+        has been sent. Returns whether the pulse train is still busy.
+        """
+        if PulseTrain._active.get(self._pi) is not self:
+            return False
+        if len(self._wave_ids) == 2 and self._pi.wave_tx_at() != self._wave_ids[0]:
+            # The first waveform has been sent completely.
+            self._pi.wave_delete(self._wave_ids.pop(0))
+            self._send_next_chunk()
+        busy = bool(self._pi.wave_tx_busy())
+        if not busy:
+            self._delete_waves()
+            del PulseTrain._active[self._pi]
+        return busy
+
+    def stop(self) -> None:
+        """Abort the pulse train."""
+        if PulseTrain._active.get(self._pi) is not self:
+            return
+        if self._wave_ids:
+            self._pi.wave_tx_stop()
+            self._delete_waves()
+        self._delays_us = None
+        del PulseTrain._active[self._pi]
+
+    def _send_next_chunk(self) -> None:
+        if self._delays_us is None or self._idx >= self._delays_us.shape[0]:
+            return
+        chunk = self._delays_us[self._idx:self._idx + self.chunk_size]
+        self._idx += chunk.shape[0]
+        width = self.pulse_width_us
+        pulses = []
+        for delay in chunk.tolist():
+            pulses.append(pigpio.pulse(self._mask, 0, width))
+            pulses.append(pigpio.pulse(0, self._mask, max(delay - width, 1)))
+        self._pi.wave_add_generic(pulses)
+        wave_id = self._pi.wave_create()
+        mode = pigpio.WAVE_MODE_ONE_SHOT_SYNC if self._wave_ids else pigpio.WAVE_MODE_ONE_SHOT
+        self._pi.wave_send_using_mode(wave_id, mode)
+        self._wave_ids.append(wave_id)
+
+    def _delete_waves(self) -> None:
+        for wave_id in self._wave_ids:
+            self._pi.wave_delete(wave_id)
+        self._wave_ids.clear()
@@ -1,5 +1,4 @@
 import logging
-import time
 from pyberryplc.core.gpio import DigitalOutput
 from pyberryplc.stepper.driver import StepperMotor
 from pyberryplc.stepper.uart.tmc2208_uart import TMC2208UART
@@ -19,6 +18,7 @@ class TMC2208StepperMotor(StepperMotor):
     The driver is enabled either through GPIO (enable pin) or via UART using 
     register settings.
     """
+    __slots__ = ('ms1', 'ms2', 'uart', 'high_sensitivity')
     
     MICROSTEP_CONFIG_GPIO: dict[str, tuple[int, int]] = {
         "1/2": (1, 0),
@@ -111,21 +111,18 @@ class TMC2208StepperMotor(StepperMotor):
         """
         if self.uart is not None:
             self.uart.open()
-            self.uart.update_register(
-                reg_name="GCONF", 
-                fields={
+            # Both registers are read first and then written back in this 
+            # order, so GCONF is configured before the driver is switched on.
+            self.uart.update_registers({
+                "GCONF": {
                     "pdn_disable": True,        # PDN_UART input function disabled. 
                     "mstep_reg_select": True    # Microstep resolution selected by MSTEP register
-                }
-            )
-            time.sleep(0.005)
-            self.uart.update_register(
-                reg_name="CHOPCONF", 
-                fields={
+                },
+                "CHOPCONF": {
                     "toff": 3,  # enable driver - Off time setting controls duration of slow decay phase
                     "vsense": self.high_sensitivity,
                 }
-            )
+            })
             self.logger.info("Driver enabled")
         else:
             super().enable()
@@ -165,21 +162,20 @@ class TMC2208StepperMotor(StepperMotor):
         ValueError :
             If the microstep resolution is unavailable on the TMC2208 driver.
         """
-        valid_resolutions = (
-            list(self.MICROSTEP_CONFIG_UART.keys()) 
+        config = (
+            self.MICROSTEP_CONFIG_UART 
             if self.uart is not None 
             else 
-            list(self.MICROSTEP_CONFIG_GPIO.keys())
+            self.MICROSTEP_CONFIG_GPIO
         )
-        if microstep_resolution in valid_resolutions:
-            microstep_factor = self.MICROSTEP_FACTORS[microstep_resolution]
-            return microstep_resolution, microstep_factor
-        else:
+        if microstep_resolution not in config:
             raise ValueError(
                 f"Microstep resolution '{microstep_resolution}' is "
                 f"unavailable on this driver. "
-                f"Available: {valid_resolutions}"
+                f"Available: {list(config)}"
             )
+        microstep_factor = self.MICROSTEP_FACTORS[microstep_resolution]
+        return microstep_resolution, microstep_factor
     
     def set_microstepping(self) -> None:
         """Configures microstepping on the TMC2208 driver."""
@@ -195,8 +191,8 @@ class TMC2208StepperMotor(StepperMotor):
             self.ms1.write(ms1_val)
             self.ms2.write(ms2_val)
             self.logger.info(
-                f"Microstepping set to {self.microstep_resolution} "
-                f"(MS1={ms1_val}, MS2={ms2_val})"
+                "Microstepping set to %s (MS1=%d, MS2=%d)",
+                self.microstep_resolution, ms1_val, ms2_val
             )
         else:
             self.logger.warning(
@@ -208,8 +204,8 @@ class TMC2208StepperMotor(StepperMotor):
         mres = self.MICROSTEP_CONFIG_UART[self.microstep_resolution]
         self.uart.update_register("CHOPCONF", {"mres": mres})
         self.logger.info(
-            f"Setting microstepping via UART: {self.microstep_resolution} "
-            f"(mres = {mres})"
+            "Setting microstepping via UART: %s (mres = %d)",
+            self.microstep_resolution, mres
         )
 
     def set_current_via_uart(
@@ -264,6 +260,6 @@ class TMC2208StepperMotor(StepperMotor):
             ihold_delay=ihold_delay
         ))
         self.logger.info(
-            f"UART current config set: IRUN={irun}/31, IHOLD={ihold}/31, "
-            f"DELAY={ihold_delay}"
+            "UART current config set: IRUN=%d/31, IHOLD=%d/31, DELAY=%d",
+            irun, ihold, ihold_delay
         )
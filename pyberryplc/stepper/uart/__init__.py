@@ -3,7 +3,9 @@ UART-based helper classes for configuring Trinamic stepper drivers.
 """
 
 from pyberryplc.stepper.uart.tmc2208_uart import TMC2208UART
+from pyberryplc.stepper.uart.tmc2208_uart_async import TMC2208UARTAsync
 
 __all__ = [
     "TMC2208UART",
+    "TMC2208UARTAsync",
 ]
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from .uart_registers import Register
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GCONFRegister(Register):
     """
     Parsed representation of the GCONF register (0x00).
@@ -54,7 +54,7 @@ class GCONFRegister(Register):
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GSTATRegister(Register):
     """
     Parsed representation of the GSTAT register (0x01).
@@ -74,10 +74,18 @@ class GSTATRegister(Register):
     
     @classmethod
     def field_layout(cls) -> dict[str, tuple[int, int]]:
-        pass
+        """
+        Returns the bit-layout of the GSTAT register as a mapping from
+        field names to (bit-position, bit-width).
+        """
+        return {
+            "reset":    (0, 1),
+            "drv_err":  (1, 1),
+            "uv_cp":    (2, 1),
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IOINRegister(Register):
     """
     Parsed representation of the IOIN register (0x06).
@@ -109,10 +117,24 @@ class IOINRegister(Register):
     
     @classmethod
     def field_layout(cls) -> dict[str, tuple[int, int]]:
-        pass
+        """
+        Returns the bit-layout of the IOIN register as a mapping from
+        field names to (bit-position, bit-width).
+        """
+        return {
+            "enn":        (0, 1),
+            "ms1":        (2, 1),
+            "ms2":        (3, 1),
+            "diag":       (4, 1),
+            "pdn_uart":   (6, 1),
+            "step":       (7, 1),
+            "sel_a":      (8, 1),
+            "dir":        (9, 1),
+            "version":    (24, 8),
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CHOPCONFRegister(Register):
     """
     Parsed representation of the CHOPCONF register (0x6C).
@@ -164,7 +186,7 @@ class CHOPCONFRegister(Register):
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DRVSTATUSRegister(Register):
     """
     Parsed representation of the DRV_STATUS register (0x6F).
@@ -200,10 +222,26 @@ class DRVSTATUSRegister(Register):
     
     @classmethod
     def field_layout(cls) -> dict[str, tuple[int, int]]:
-        pass
+        """
+        Returns the bit-layout of the DRV_STATUS register as a mapping from
+        field names to (bit-position, bit-width).
+        """
+        return {
+            "otpw":       (0, 1),
+            "ot":         (1, 1),
+            "s2ga":       (2, 1),
+            "s2gb":       (3, 1),
+            "s2vsa":      (4, 1),
+            "s2vsb":      (5, 1),
+            "ola":        (6, 1),
+            "olb":        (7, 1),
+            "cs_actual":  (16, 5),
+            "stealth":    (30, 1),
+            "stst":       (31, 1),
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IHOLDIRUNRegister(Register):
     """
     Parsed representation of the IHOLD_IRUN register (0x10).
@@ -1,4 +1,6 @@
 from typing import Optional
+from dataclasses import replace
+import struct
 import serial
 import time
 from .uart_registers import Register
@@ -12,6 +14,38 @@ from .tmc2208_registers import (
 )
 
 
+def _crc_tables() -> tuple[bytes, bytes]:
+    """Returns the lookup tables for the CRC8 (polynomial 0x07) used in the 
+    UART datagrams of the TMC2208. 
+    
+    The datagram bytes are shifted into the CRC starting from their least 
+    significant bit. This is the same as shifting in the bit-reversed bytes 
+    starting from their most significant bit, so the CRC can be updated one
+    byte at a time with the table of the common MSB-first CRC8. The first
+    table holds the bit-reversed value of each byte, the second table holds 
+    the CRC8 of each byte value.
+    """
+    reverse = bytes(int(f"{byte:08b}"[::-1], 2) for byte in range(256))
+    table = bytearray(256)
+    for index in range(256):
+        crc = index
+        for _ in range(8):
+            if crc & 0x80:
+                crc = ((crc << 1) ^ 0x07) & 0xFF
+            else:
+                crc = (crc << 1) & 0xFF
+        table[index] = crc
+    return reverse, bytes(table)
+
+
+_CRC_REVERSE, _CRC_TABLE = _crc_tables()
+
+# Layouts of the datagram fields without the CRC byte (big-endian).
+_READ_REQUEST = struct.Struct(">BBB")
+_WRITE_ACCESS = struct.Struct(">BBBI")
+_DATA = struct.Struct(">I")
+
+
 class TMC2208UART:
     """
     UART communication helper for Trinamic TMC2208 driver.
@@ -40,6 +74,12 @@ class TMC2208UART:
         "DRV_STATUS": (0x6F, DRVSTATUSRegister, "R"),
         "IHOLD_IRUN": (0x10, IHOLDIRUNRegister, "W")
     }
+    # Addresses of the registers whose last known value is kept (GCONF,
+    # CHOPCONF and IHOLD_IRUN). These hold configuration only, which the 
+    # driver never changes by itself. Registers that are changed by the 
+    # hardware, like GSTAT (whose flags are set by the driver and cleared by
+    # writing 1), are always read before they are modified.
+    SHADOWED_REGISTERS = frozenset({0x00, 0x6C, 0x10})
     
     def __init__(
         self,
@@ -53,12 +93,24 @@ class TMC2208UART:
         self.timeout = timeout
         self.slave_address = slave_address
         self.serial: Optional[serial.Serial] = None
+        # Last known value of each register in `SHADOWED_REGISTERS` (by 
+        # address), i.e. the value last written to or read from the driver.
+        # Partial register updates use it instead of reading the register 
+        # back from the driver.
+        self._shadow: dict[int, int] = {}
+        # Buffers that are reused for all datagrams: the read request, the 
+        # response (preceded by the echo of the request), and a write access.
+        self._request_buf = bytearray(4)
+        self._response_buf = bytearray(12)
+        self._write_buf = bytearray(8)
 
     def open(self) -> None:
         """
         Opens the serial port if it is not already open.
         """
         if not self.serial or not self.serial.is_open:
+            # The driver may have been reset meanwhile.
+            self._shadow.clear()
             self.serial = serial.Serial(
                 port=self.port,
                 baudrate=self.baudrate,
@@ -70,9 +122,19 @@ class TMC2208UART:
         Closes the serial port if it is open.
         """
         if self.serial and self.serial.is_open:
+            self.serial.flush()
             self.serial.close()
 
+    def flush(self) -> None:
+        """
+        Waits until all datagrams written to the serial port have been 
+        transmitted.
+        """
+        if self.serial and self.serial.is_open:
+            self.serial.flush()
+
     def __enter__(self) -> "TMC2208UART":
+        self._shadow.clear()
         self.serial = serial.Serial(
             port=self.port,
             baudrate=self.baudrate,
@@ -81,19 +143,17 @@ class TMC2208UART:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        if self.serial and self.serial.is_open:
-            self.serial.close()
+        self.close()
     
     @staticmethod
-    def _calculate_crc(data: list[int]) -> int:
+    def _calculate_crc(data: bytes | bytearray | memoryview) -> int:
+        """Returns the CRC8 checksum of the datagram bytes in `data` (i.e.
+        without the CRC byte itself), as defined in the TMC2208 datasheet.
+        """
         crc = 0
-        for byte in data:
-            for _ in range(8):
-                if (crc >> 7) ^ (byte & 0x01):
-                    crc = ((crc << 1) ^ 0x07) & 0xFF
-                else:
-                    crc = (crc << 1) & 0xFF
-                byte >>= 1
+        table = _CRC_TABLE
+        for byte in bytes(data).translate(_CRC_REVERSE):
+            crc = table[crc ^ byte]
         return crc
 
     def read_register_addr(self, reg_addr: int) -> int:
@@ -121,19 +181,22 @@ class TMC2208UART:
         if not self.serial or not self.serial.is_open:
             raise IOError("Serial port is not open.")
 
-        request = [0x05, self.slave_address, reg_addr & 0x7F]
-        request.append(self._calculate_crc(request))
+        request = self._request_buf
+        _READ_REQUEST.pack_into(request, 0, 0x05, self.slave_address, reg_addr & 0x7F)
+        request[3] = self._calculate_crc(request[:3])
 
+        self.flush()                       # send pending write datagrams
+        time.sleep(10 / self.baudrate)     # and receive the echo of the last byte
         self.serial.reset_input_buffer()   # clear RX-buffer
-        self.serial.write(bytes(request))  # write request
+        self.serial.write(request)         # write request
         self.serial.flush()                # send full request
         time.sleep(0.005)
-        response = self.serial.read(12)    # wait for answer 
+        n = self.serial.readinto(self._response_buf)  # wait for answer 
         
-        if len(response) < 12:
+        if n < 12:
             raise IOError("Incomplete response received from driver.")
 
-        response = response[4:]  # skip echo (first 4 bytes)
+        response = self._response_buf[4:]  # skip echo (first 4 bytes)
                 
         if response[0] != 0x05:
             raise IOError(f"Invalid sync byte in response: 0x{response[0]:02X}")
@@ -141,15 +204,12 @@ class TMC2208UART:
             raise IOError(f"Invalid master address: 0x{response[1]:02X}")
         if response[2] != (reg_addr & 0x7F):
             raise IOError(f"Unexpected register address in response: 0x{response[2]:02X}")
-        if self._calculate_crc(list(response[:7])) != response[7]:
+        if self._calculate_crc(response[:7]) != response[7]:
             raise IOError("CRC check failed for received response.")
 
-        value = (
-            (response[3] << 24) |
-            (response[4] << 16) |
-            (response[5] << 8) |
-            response[6]
-        )
+        value, = _DATA.unpack_from(response, 3)
+        if reg_addr in self.SHADOWED_REGISTERS:
+            self._shadow[reg_addr] = value
         return value
 
     def write_register_addr(self, reg_addr: int, value: int) -> None:
@@ -158,6 +218,11 @@ class TMC2208UART:
         
         This is a low-level function. For easier use, `write_register()`
         is recommended. 
+
+        The function returns as soon as the datagram has been handed to the
+        serial port, without waiting until it has been transmitted. Pending
+        datagrams are sent before the next read access, and when the port is
+        closed. Use `flush()` to wait until they have been transmitted.
         
         Parameters
         ----------
@@ -174,20 +239,27 @@ class TMC2208UART:
         if not self.serial or not self.serial.is_open:
             raise IOError("Serial port is not open.")
 
-        datagram = [
-            0x05,                    # Sync
-            self.slave_address,      # Slave address
-            reg_addr | 0x80,         # Write bit (MSB set)
-            (value >> 24) & 0xFF,    # Data byte 1 (MSB)
-            (value >> 16) & 0xFF,    # Data byte 2
-            (value >> 8) & 0xFF,     # Data byte 3
-            value & 0xFF             # Data byte 4 (LSB)
-        ]
-        crc = self._calculate_crc(datagram)
-        datagram.append(crc)
-
-        self.serial.write(bytes(datagram))
-        self.serial.flush()
+        self._pack_write_datagram(self._write_buf, 0, reg_addr, value)
+        self.serial.write(self._write_buf)
+        if reg_addr in self.SHADOWED_REGISTERS:
+            self._shadow[reg_addr] = value
+
+    def _pack_write_datagram(
+        self, 
+        buf: bytearray, 
+        offset: int, 
+        reg_addr: int, 
+        value: int
+    ) -> None:
+        """Puts the write access datagram that writes `value` to the register
+        at address `reg_addr` in the 8 bytes of `buf` starting at `offset`.
+        """
+        # Sync, slave address, register address with write bit (MSB) set and
+        # the 32-bit value (MSB first).
+        _WRITE_ACCESS.pack_into(
+            buf, offset, 0x05, self.slave_address, reg_addr | 0x80, value
+        )
+        buf[offset + 7] = self._calculate_crc(buf[offset:offset + 7])
 
     def update_register_addr(self, reg_addr: int, mask: int, value: int) -> None:
         """
@@ -233,37 +305,79 @@ class TMC2208UART:
         IOError
             If reading or writing the register fails.
         """
-        if reg_name not in self.REGISTER_CLASS_MAP:
-            raise ValueError(f"Unknown register '{reg_name}'")
+        self.update_registers({reg_name: fields})
 
-        addr, reg_class, access = self.REGISTER_CLASS_MAP[reg_name]
-        if "W" not in access:
-            raise IOError(f"Register '{reg_name}' is not writeable.")
-        if "R" not in access:
-            raise IOError(
-                f"Register '{reg_name}' is not readable, "
-                f"so it cannot be updated partially."
-            )
-        
-        current = self.read_register(reg_name)
-        layout = reg_class.field_layout()
-
-        for key, new_value in fields.items():
-            if key not in layout:
-                raise ValueError(
-                    f"Invalid field '{key}' for register '{reg_name}'"
-                )
-            width = layout[key][1]
-            if isinstance(new_value, bool):
-                new_value = int(new_value)
+    def update_registers(self, updates: dict[str, dict[str, int]]) -> None:
+        """
+        Updates specific fields in several registers at once.
 
-            if not (0 <= new_value < (1 << width)):
-                raise ValueError(f"Value {new_value} is out of range for field '{key}'")
+        All fields are validated before any register is accessed. Next, the
+        current value of each configuration register (see 
+        `SHADOWED_REGISTERS`) is taken from the last value written to or read
+        from the driver, and is only read from the driver if it is not known
+        yet. Other registers are always read from the driver. Finally, the write datagrams of all modified registers 
+        are sent together in the order of `updates`, with a single write to 
+        the serial port (see `write_register_addr()` about when they are 
+        transmitted).
 
-            setattr(current, key, new_value)
+        Parameters
+        ----------
+        updates : dict[str, dict[str, int]]
+            Mapping of register names to the mapping of field names to values
+            for that register (e.g., {"CHOPCONF": {"toff": 3, "mres": 5}}).
 
-        # Write the modified `Register` object back to the driver's register
-        self.write_register(reg_name, current)
+        Raises
+        ------
+        ValueError
+            If register or field key is unknown, or value is too large.
+        IOError
+            If reading or writing the registers fails.
+        """
+        for reg_name, fields in updates.items():
+            if reg_name not in self.REGISTER_CLASS_MAP:
+                raise ValueError(f"Unknown register '{reg_name}'")
+
+            addr, reg_class, access = self.REGISTER_CLASS_MAP[reg_name]
+            if "W" not in access:
+                raise IOError(f"Register '{reg_name}' is not writeable.")
+            if "R" not in access:
+                raise IOError(
+                    f"Register '{reg_name}' is not readable, "
+                    f"so it cannot be updated partially."
+                )
+            
+            layout = reg_class.field_layout()
+            for key, new_value in fields.items():
+                if key not in layout:
+                    raise ValueError(
+                        f"Invalid field '{key}' for register '{reg_name}'"
+                    )
+                width = layout[key][1]
+                if isinstance(new_value, bool):
+                    new_value = int(new_value)
+
+                if not (0 <= new_value < (1 << width)):
+                    raise ValueError(f"Value {new_value} is out of range for field '{key}'")
+
+        new_values = {}
+        for reg_name, fields in updates.items():
+            addr, reg_class, _ = self.REGISTER_CLASS_MAP[reg_name]
+            value = self._shadow.get(addr)
+            if value is None:
+                value = self.read_register_addr(addr)
+            current = replace(reg_class.from_int(value), **fields)
+            new_values[addr] = current.to_int()
+        
+        # Write the modified register values back to the driver's registers
+        if not self.serial or not self.serial.is_open:
+            raise IOError("Serial port is not open.")
+        datagrams = bytearray(8 * len(new_values))
+        for i, (addr, value) in enumerate(new_values.items()):
+            self._pack_write_datagram(datagrams, 8 * i, addr, value)
+        self.serial.write(datagrams)
+        for addr, value in new_values.items():
+            if addr in self.SHADOWED_REGISTERS:
+                self._shadow[addr] = value
 
     def read_register(self, reg_name: str) -> Register:
         """
@@ -277,7 +391,9 @@ class TMC2208UART:
         Returns
         -------
         Register
-            An instance of the register dataclass, e.g., GCONFRegister.
+            An instance of the register dataclass, e.g., GCONFRegister. The 
+            instance is immutable: use `dataclasses.replace()` to derive a 
+            modified copy for `write_register()`, or use `update_register()`.
 
         Raises
         ------
@@ -0,0 +1,90 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from pyberryplc.utils.realtime import enter_realtime
+from .uart_registers import Register
+from .tmc2208_uart import TMC2208UART
+
+
+class TMC2208UARTAsync:
+    """
+    Runs the UART communication with a Trinamic TMC2208 driver on a dedicated
+    worker thread.
+
+    A register access over UART blocks for a few milliseconds. When the
+    accesses are submitted to this class instead of being made directly on
+    a `TMC2208UART` object, the calling thread (e.g. the PLC scan cycle or a
+    step loop) is not held up: each method returns immediately with a
+    `Future` that holds the result once the access has been completed. The
+    accesses are executed one at a time, in the order they were submitted.
+
+    This class is a context manager, ensuring the serial port is closed and
+    the worker thread is stopped after use.
+
+    Parameters
+    ----------
+    uart : TMC2208UART
+        UART interface to the driver. It should not be used directly anymore
+        by other threads.
+    cpu : int | None, optional
+        CPU core to pin the worker thread to, e.g. a core that is reserved for
+        I/O so that it does not compete with the timing-critical code. If None
+        (default), the CPU affinity of the worker thread is not changed.
+    """
+    def __init__(self, uart: TMC2208UART, cpu: int | None = None) -> None:
+        self.uart = uart
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="TMC2208UART",
+            initializer=enter_realtime,
+            initargs=(cpu, None, False)
+        )
+
+    def open(self) -> Future[None]:
+        """Opens the serial port if it is not already open."""
+        return self._executor.submit(self.uart.open)
+
+    def close(self) -> Future[None]:
+        """Closes the serial port if it is open."""
+        return self._executor.submit(self.uart.close)
+
+    def shutdown(self) -> None:
+        """
+        Closes the serial port after all submitted accesses have been
+        completed and stops the worker thread.
+        """
+        self.close()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "TMC2208UARTAsync":
+        self.open().result()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+
+    def read_register(self, reg_name: str) -> Future[Register]:
+        """
+        Reads the given register. See `TMC2208UART.read_register()`.
+        """
+        return self._executor.submit(self.uart.read_register, reg_name)
+
+    def write_register(self, reg_name: str, reg_obj: Register) -> Future[None]:
+        """
+        Writes the full contents of a register. See
+        `TMC2208UART.write_register()`.
+        """
+        return self._executor.submit(self.uart.write_register, reg_name, reg_obj)
+
+    def update_register(self, reg_name: str, fields: dict[str, int]) -> Future[None]:
+        """
+        Updates specific fields in a register. See
+        `TMC2208UART.update_register()`.
+        """
+        return self._executor.submit(self.uart.update_register, reg_name, fields)
+
+    def update_registers(self, updates: dict[str, dict[str, int]]) -> Future[None]:
+        """
+        Updates specific fields in several registers at once. See
+        `TMC2208UART.update_registers()`.
+        """
+        return self._executor.submit(self.uart.update_registers, updates)
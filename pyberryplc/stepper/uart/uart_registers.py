@@ -1,5 +1,8 @@
 from typing import TypeVar, Type, cast
 from abc import ABC, abstractmethod
+from functools import lru_cache
+
+import numpy as np
 
 
 T = TypeVar("T", bound="Register")
@@ -8,7 +11,35 @@ T = TypeVar("T", bound="Register")
 class Register(ABC):
     """
     Abstract base class for all UART-accessible stepper driver registers.
+
+    Concrete registers are frozen dataclasses with slots: a register object
+    is an immutable snapshot of the register value, which may be shared 
+    between callers (see `from_int()`). Assigning a field therefore raises a
+    `dataclasses.FrozenInstanceError`. To change fields, create a modified 
+    copy with `dataclasses.replace()` and write that one, e.g.::
+
+        reg = uart.read_register("CHOPCONF")
+        uart.write_register("CHOPCONF", replace(reg, toff=3))
+
+    or let `TMC2208UART.update_register()` or `update_registers()` do the 
+    read-modify-write.
     """
+    __slots__ = ()
+
+    # Field specifications per register class, derived once from the field
+    # layout of the class (see `_field_specs()`).
+    _FIELD_SPECS: dict[type, tuple[tuple[str, int, int, bool], ...]] = {}
+
+    # Number of decoded values that `from_int()` caches per register class.
+    FROM_INT_CACHE_SIZE = 64
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Each register class gets its own cache of decoded values, so that
+        # e.g. polling DRV_STATUS does not evict the values of other registers.
+        cls.from_int = classmethod(
+            lru_cache(maxsize=cls.FROM_INT_CACHE_SIZE)(Register.from_int.__func__)
+        )
 
     @classmethod
     @abstractmethod
@@ -20,6 +51,22 @@ class Register(ABC):
         """
         pass
 
+    @classmethod
+    def _field_specs(cls) -> tuple[tuple[str, int, int, bool], ...]:
+        """
+        Returns a (name, bit-position, bit-mask, is-flag) tuple for each field
+        of the register. The tuples are derived from `field_layout()` the 
+        first time they are needed and are reused afterwards.
+        """
+        specs = Register._FIELD_SPECS.get(cls)
+        if specs is None:
+            specs = tuple(
+                (name, pos, (1 << width) - 1, width == 1)
+                for name, (pos, width) in cls.field_layout().items()
+            )
+            Register._FIELD_SPECS[cls] = specs
+        return specs
+
     @abstractmethod
     def as_dict(self) -> dict[str, int | bool]:
         """
@@ -43,16 +90,14 @@ class Register(ABC):
             If a field value is too large for its bit-width.
         """
         value = 0
-        layout = self.field_layout()
-
-        for name, (pos, width) in layout.items():
+        for name, pos, mask, _ in self._field_specs():
             field_value = getattr(self, name)
             if isinstance(field_value, bool):
                 field_value = int(field_value)
-            if field_value >= (1 << width):
+            if field_value > mask:
                 raise ValueError(
                     f"Value {field_value} too large for "
-                    f"field '{name}' (max {2 ** width - 1})"
+                    f"field '{name}' (max {mask})"
                 )
             value |= field_value << pos
 
@@ -60,10 +105,37 @@ class Register(ABC):
 
     @classmethod
     def from_int(cls: Type[T], value: int) -> T:
-        """Creates a `Register` instance from a 32-bit integer."""
-        field_values = {}
-        for name, (pos, width) in cls.field_layout().items():
-            mask = (1 << width) - 1
-            raw = (value >> pos) & mask
-            field_values[name] = bool(raw) if width == 1 else raw
+        """Creates a `Register` instance from a 32-bit integer.
+
+        Register objects are immutable, so the objects of recently decoded 
+        values are cached and returned again when a register is read that 
+        still has the same value. Each register class has its own cache of
+        `FROM_INT_CACHE_SIZE` values.
+        """
+        field_values = {
+            name: bool((value >> pos) & mask) if flag else (value >> pos) & mask
+            for name, pos, mask, flag in cls._field_specs()
+        }
         return cast(T, cls(**field_values))
+
+    @classmethod
+    def from_ints(cls, values: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Decodes a series of 32-bit register values at once, e.g. the values 
+        collected while polling a status register.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Mapping of each field name to the array of its values (a boolean 
+            array for single-bit fields).
+        """
+        values = np.asarray(values, dtype=np.uint32)
+        return {
+            name: (
+                ((values >> pos) & mask).astype(bool) 
+                if flag else 
+                (values >> pos) & mask
+            )
+            for name, pos, mask, flag in cls._field_specs()
+        }
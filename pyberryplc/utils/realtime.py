@@ -0,0 +1,65 @@
+"""
+Helpers to run timing-critical code (e.g. the step loop of a stepper motor)
+with as little scheduling jitter as Linux permits.
+
+The best results are obtained when the CPU core the code is pinned to is
+isolated from the Linux scheduler, the timer tick and RCU callbacks with the
+kernel boot arguments (e.g. in /boot/firmware/cmdline.txt on a Raspberry Pi):
+
+    isolcpus=3 nohz_full=3 rcu_nocbs=3
+
+Real-time scheduling and locking memory require root privileges or the
+CAP_SYS_NICE and CAP_IPC_LOCK capabilities.
+"""
+import os
+import ctypes
+import logging
+
+MCL_CURRENT = 1
+MCL_FUTURE = 2
+
+
+def enter_realtime(
+    cpu: int | None = None,
+    priority: int | None = 80,
+    lock_memory: bool = True,
+    logger: logging.Logger | None = None
+) -> None:
+    """
+    Configures the calling thread for timing-critical work.
+
+    Settings that cannot be applied (e.g. due to missing privileges) are
+    skipped with a warning, so that the code still runs, only with more
+    jitter.
+
+    Parameters
+    ----------
+    cpu : int | None, optional
+        CPU core to pin the calling thread to. If None (default), the CPU
+        affinity is left unchanged.
+    priority : int | None, optional
+        Priority (1-99) of the SCHED_FIFO real-time scheduling policy. Default
+        is 80. If None, the scheduling policy is left unchanged.
+    lock_memory : bool, optional
+        If True (default), all current and future memory pages of the process
+        are locked into RAM, so that the timing-critical code cannot be
+        delayed by page faults.
+    logger : logging.Logger | None, optional
+        Logger for the warnings.
+    """
+    logger = logger or logging.getLogger(__name__)
+    if cpu is not None:
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except OSError as err:
+            logger.warning("Could not pin thread to CPU %d: %s", cpu, err)
+    if priority is not None:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        except OSError as err:
+            logger.warning("Could not set SCHED_FIFO priority %d: %s", priority, err)
+    if lock_memory:
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+            err = ctypes.get_errno()
+            logger.warning("Could not lock memory: %s", os.strerror(err))
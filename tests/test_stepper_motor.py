@@ -0,0 +1,63 @@
+"""
+Tests of the step generation of `StepperMotor` that run without a Raspberry
+Pi: the connection to the pigpio daemon is replaced by a mock, so that each
+step pulse is recorded as a call of `gpio_trigger()`.
+"""
+from unittest import mock
+
+import pytest
+
+pigpio = pytest.importorskip("pigpio")
+pytest.importorskip("gpiozero")
+
+
+class FixedDelayGenerator:
+    """Stands in for a `DynamicDelayGenerator` that ends after `n` delays."""
+    def __init__(self, n: int, delay: float = 1e-4) -> None:
+        self.n = n
+        self.delay = delay
+
+    def next_delay(self) -> float:
+        if self.n == 0:
+            raise StopIteration("Motion complete.")
+        self.n -= 1
+        return self.delay
+
+
+@pytest.fixture(scope="module")
+def connection():
+    with mock.patch.object(pigpio, "pi") as pi:
+        conn = pi.return_value
+        conn.get_hardware_revision.return_value = 0xA02082
+        modes = {}
+        conn.set_mode.side_effect = modes.__setitem__
+        conn.get_mode.side_effect = lambda pin: modes.get(pin, pigpio.INPUT)
+        conn.read.return_value = 0
+        # The default pin factory connects to the daemon on import, so the
+        # package must be imported while the connection is mocked.
+        import pyberryplc.core.gpio
+        yield conn
+
+
+@pytest.fixture
+def motor(connection):
+    from pyberryplc.stepper.driver.a4988 import A4988StepperMotor
+    motor = A4988StepperMotor(step_pin=17, dir_pin=27)
+    connection.gpio_trigger.reset_mock()
+    return motor
+
+
+def test_dynamic_rotation_step_count(motor, connection):
+    # A blocking and a non-blocking dynamic rotation must generate the same
+    # number of steps: a pulse for each delay and a final one before the
+    # generator reports the end of the motion.
+    motor.rotate_dynamic(FixedDelayGenerator(20))
+    n_blocking = connection.gpio_trigger.call_count
+
+    connection.gpio_trigger.reset_mock()
+    motor.start_rotation_dynamic(FixedDelayGenerator(20))
+    while motor.busy:
+        motor.do_single_step()
+    n_non_blocking = connection.gpio_trigger.call_count
+
+    assert n_blocking == n_non_blocking == 21